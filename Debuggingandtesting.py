@@ -15,9 +15,16 @@ import unittest
 def is_prime(n):
     if n < 2:
         return False
-    for i in range(2, n):
-        if n % i == 0:
+    if n < 4:
+        return True
+    if n % 2 == 0 or n % 3 == 0:
+        return False
+    # Every prime above 3 has the form 6k-1 or 6k+1, so only test those up to sqrt(n)
+    i = 5
+    while i * i <= n:
+        if n % i == 0 or n % (i + 2) == 0:
             return False
+        i += 6
     return True
 
 class TestIsPrime(unittest.TestCase):
@@ -36,15 +43,20 @@ if __name__ == '__main__':
 
 import re
 
+# Compile patterns once and reuse them instead of passing string literals to re.*
+# (a library such as hyperscan can be swapped in for very hot paths)
+_PHONE_RE = re.compile(r'\d{3}-\d{4}')
+_EMAIL_RE = re.compile(r'\S+@\S+')
+
 # Search for a phone number in a string
 text = 'My phone number is 555-7777'
-match = re.search(r'\d{3}-\d{4}', text)
+match = _PHONE_RE.search(text)
 if match:
     print(match.group(0))
 
 # Extract email addresses from a string
 text = 'My email is example@devops.com, but I also use other@cloud.com'
-matches = re.findall(r'\S+@\S+', text)
+matches = _EMAIL_RE.findall(text)
 print(matches)
 
 
@@ -1,15 +1,34 @@
-from dataclasses import dataclass
-from typing import List, Optional, Callable, Dict, Any
-from functools import lru_cache
+from dataclasses import dataclass, field, fields
+from typing import List, Optional, Callable, Dict, Any, Tuple, Iterator, Iterable
 import csv
 import os
-from abc import ABC, abstractmethod
+import sys
 import logging
 from enum import Enum
 from concurrent.futures import ThreadPoolExecutor
 import threading
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
+from array import array
+from bisect import bisect_left
+from itertools import compress, count, islice, repeat
+from operator import contains, eq
+import queue
 import time
+import unicodedata
+
+try:
+    # Optional: vectorized CSV parsing; falls back to the csv module when missing
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = None
+
+try:
+    # Optional: JIT-compiled substring scan for large catalogs
+    import numpy as np
+    from numba import njit, prange
+except ImportError:
+    njit = None
 
 # Configure logging
 logging.basicConfig(
@@ -29,100 +48,412 @@ class Movie:
     title: str
     release_year: int
     director: str
+    # Case-folded variants computed once at load time for case-insensitive search
+    title_lc: str = field(default='', repr=False, compare=False)
+    director_lc: str = field(default='', repr=False, compare=False)
 
     def __hash__(self):
         return hash((self.title, self.release_year, self.director))
 
-class SearchStrategy(ABC):
-    """Abstract base class for search strategies"""
-    @abstractmethod
-    def search(self, movies: List[Movie], query: Any) -> List[Movie]:
-        pass
+@dataclass(frozen=True)
+class MovieTable:
+    """Column-oriented storage for loaded movies; row i across all columns is one movie"""
+    titles: List[str]
+    titles_lc: List[str]
+    years: array
+    directors: List[str]
+    directors_lc: List[str]
+
+    @classmethod
+    def empty(cls) -> 'MovieTable':
+        return cls([], [], array('i'), [], [])
+
+    def __len__(self) -> int:
+        return len(self.titles)
+
+    def extend(self, other: 'MovieTable') -> None:
+        for f in fields(self):
+            getattr(self, f.name).extend(getattr(other, f.name))
+
+    def movie(self, i: int) -> Movie:
+        """Materialize row i as a Movie"""
+        return Movie(self.titles[i], self.years[i], self.directors[i],
+                     self.titles_lc[i], self.directors_lc[i])
+
+@dataclass(frozen=True)
+class MovieSnapshot:
+    """One consistent view of the loaded data; a reload replaces it as a whole"""
+    table: MovieTable
+    index: Dict[str, Dict[str, array]]
+    # Increases with every load; ties cached results to the data they came from
+    generation: int = 0
+    # Packed byte buffers of the folded columns for the Numba scan, built on first use
+    packed: Dict[str, Tuple[Any, Any]] = field(default_factory=dict)
+
+    def packed_column(self, name: str) -> Optional[Tuple[Any, Any]]:
+        """Packed buffers of a folded column, or None when the Numba scan is off"""
+        if njit is None or len(self.table) < NUMBA_SCAN_MIN_ROWS:
+            return None
+        packed = self.packed.get(name)
+        if packed is None:
+            packed = self.packed.setdefault(name, _pack_strings(getattr(self.table, f'{name}s_lc')))
+        return packed
+
+    def materialize(self, indices: Iterable[int]) -> List[Movie]:
+        """Build Movie objects for the given row indices only"""
+        table = self.table
+        return [table.movie(i) for i in indices]
+
+# Length of the character n-grams used by the substring index
+NGRAM_SIZE = 3
+
+def _ngrams(text: str, n: int = NGRAM_SIZE) -> set:
+    """Return the set of overlapping n-grams in text"""
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+def _fold(text: str) -> str:
+    """Normalize text for Unicode-aware case-insensitive matching"""
+    return unicodedata.normalize('NFKD', text).casefold()
+
+def _dedupe(values: List[str], cache: Dict[str, str]) -> List[str]:
+    """Replace equal strings with one shared instance, remembered in cache"""
+    return list(map(cache.setdefault, values, values))
 
-class TitleSearchStrategy(SearchStrategy):
-    def search(self, movies: List[Movie], query: str) -> List[Movie]:
-        query = query.lower()
-        return [movie for movie in movies if query in movie.title.lower()]
+def _intersect_sorted(lists: List[array]) -> List[int]:
+    """Intersect sorted posting lists by probing from the shortest with bisect"""
+    if not lists:
+        return []
+    lists = sorted(lists, key=len)
+    result = list(lists[0])
+    for other in lists[1:]:
+        matched = []
+        lo, hi = 0, len(other)
+        for value in result:
+            lo = bisect_left(other, value, lo, hi)
+            if lo == hi:
+                break
+            if other[lo] == value:
+                matched.append(value)
+        result = matched
+        if not result:
+            break
+    return result
 
-class YearSearchStrategy(SearchStrategy):
-    def search(self, movies: List[Movie], query: int) -> List[Movie]:
-        return [movie for movie in movies if movie.release_year == query]
+def _substring_search(snapshot: MovieSnapshot, field: str, query: str) -> List[int]:
+    """Case-insensitive substring search backed by the n-gram index"""
+    values = getattr(snapshot.table, f'{field}s_lc')
+    postings = snapshot.index.get(f'{field}_ngram')
 
-class DirectorSearchStrategy(SearchStrategy):
-    def search(self, movies: List[Movie], query: str) -> List[Movie]:
-        query = query.lower()
-        return [movie for movie in movies if query in movie.director.lower()]
+    if len(query) < NGRAM_SIZE or not postings:
+        packed = snapshot.packed_column(field)
+        if packed is not None:
+            # UTF-8 is self-synchronizing, so a byte match is a substring match
+            needle = np.frombuffer(query.encode('utf-8'), dtype=np.uint8)
+            return np.flatnonzero(_scan(*packed, needle)).tolist()
+        # map/compress keep the whole scan in C, with no per-row bytecode
+        return list(compress(count(), map(contains, values, repeat(query))))
+
+    lists = []
+    for gram in _ngrams(query):
+        posting = postings.get(gram)
+        if not posting:
+            return []
+        lists.append(posting)
+
+    # n-gram hits are only candidates; verify the full substring on each
+    return [i for i in _intersect_sorted(lists) if query in values[i]]
+
+# Catalog size from which the linear fallback scan switches to the Numba kernel
+NUMBA_SCAN_MIN_ROWS = 100_000
+
+if njit is not None:
+    @njit(cache=True)
+    def _memmem(buf, start, end, needle):
+        """True if needle occurs in buf[start:end]"""
+        n = len(needle)
+        for i in range(start, end - n + 1):
+            j = 0
+            while j < n and buf[i + j] == needle[j]:
+                j += 1
+            if j == n:
+                return True
+        return False
+
+    @njit(parallel=True, cache=True)
+    def _scan(buf, offsets, needle):
+        """Match needle against every string packed into buf, in parallel"""
+        out = np.zeros(len(offsets) - 1, np.bool_)
+        for i in prange(len(offsets) - 1):
+            out[i] = _memmem(buf, offsets[i], offsets[i + 1], needle)
+        return out
+
+_scan_compiled = False
+
+def _warm_up_scan() -> None:
+    """Compile _scan ahead of the first interactive query"""
+    global _scan_compiled
+    if not _scan_compiled:
+        # Same array kinds as real calls (read-only uint8 buffers), so the
+        # compiled specialization is reused rather than compiled again
+        _scan(*_pack_strings(['a']), np.frombuffer(b'a', dtype=np.uint8))
+        _scan_compiled = True
+
+def _pack_strings(values: List[str]) -> Tuple[Any, Any]:
+    """Concatenate UTF-8 encoded values into one byte buffer plus start offsets"""
+    encoded = [value.encode('utf-8') for value in values]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(value) for value in encoded], out=offsets[1:])
+    buf = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+    return buf, offsets
+
+# Search functions take a snapshot and a query and return matching row indices
+# into that same snapshot's table
+
+def search_title(snapshot: MovieSnapshot, query: str) -> List[int]:
+    return _substring_search(snapshot, 'title', _fold(query))
+
+def search_year(snapshot: MovieSnapshot, query: int) -> List[int]:
+    year_index = snapshot.index.get('year')
+    if year_index:
+        return list(year_index.get(str(query), ()))
+    return list(compress(count(), map(eq, snapshot.table.years, repeat(query))))
+
+def search_director(snapshot: MovieSnapshot, query: str) -> List[int]:
+    return _substring_search(snapshot, 'director', _fold(query))
 
 class MovieDataSource:
     """Handle data loading and caching"""
-    def __init__(self, filename: str):
+    def __init__(self, filename: str, on_reload: Optional[Callable[[], None]] = None,
+                 mtime_check_interval: float = 1.0):
         self.filename = filename
-        self._movies: Optional[List[Movie]] = None
+        self.on_reload = on_reload
+        self._snapshot: Optional[MovieSnapshot] = None
         self._last_modified: float = 0
+        self._generation = 0
+        # Throttle the stat() freshness check to once per interval (seconds)
+        self._mtime_check_time: float = 0.0
+        self._mtime_check_interval = mtime_check_interval
         self._lock = threading.Lock()
-        self._index: Dict[str, Dict[str, List[Movie]]] = defaultdict(lambda: defaultdict(list))
 
     @property
-    def movies(self) -> List[Movie]:
-        """Thread-safe lazy loading with file modification check"""
+    def snapshot(self) -> MovieSnapshot:
+        """Thread-safe lazy loading with throttled file modification check
+
+        Uses double-checked locking: the hot path reads self._snapshot without
+        taking the lock, which is only acquired when a reload may be needed.
+        Callers should read this once per operation and use that snapshot
+        throughout, so a concurrent reload cannot mix old and new data.
+        """
+        snapshot = self._snapshot
+        now = time.monotonic()
+        if snapshot is not None and now - self._mtime_check_time < self._mtime_check_interval:
+            return snapshot
+
         current_mtime = os.path.getmtime(self.filename)
+        self._mtime_check_time = now
+        if snapshot is not None and current_mtime <= self._last_modified:
+            return snapshot
         
         with self._lock:
-            if self._movies is None or current_mtime > self._last_modified:
+            # Another thread may have reloaded while we waited for the lock
+            if self._snapshot is None or current_mtime > self._last_modified:
                 self._load_movies()
                 self._last_modified = current_mtime
             
-            return self._movies
+            return self._snapshot
+
+    @property
+    def table(self) -> MovieTable:
+        return self.snapshot.table
+
+    @property
+    def index(self) -> Dict[str, Dict[str, array]]:
+        return self.snapshot.index
+
+    @property
+    def movies(self) -> List[Movie]:
+        """All loaded movies, materialized from the column storage"""
+        table = self.table
+        return [table.movie(i) for i in range(len(table))]
+
+    def reload(self) -> MovieSnapshot:
+        """Force a freshness check on the next access, bypassing the throttle"""
+        self._mtime_check_time = 0.0
+        return self.snapshot
+
+    def _stream_movies(self, chunk_size: int = 8192) -> Iterator[MovieTable]:
+        """Parse the CSV lazily, yielding column chunks of at most chunk_size rows"""
+        # Directors repeat heavily across a catalog; share one string per name
+        intern_cache: Dict[str, str] = {}
+        if pa is not None:
+            yield from self._stream_movies_arrow(chunk_size, intern_cache)
+            return
+
+        with open(self.filename, 'r', encoding='utf-8', newline='') as file:
+            reader = csv.reader(file)
+            header = next(reader, None)
+            if header is None:
+                # Empty file: no header and no movies
+                return
+            # Resolve column positions once instead of building a dict per row
+            ti = header.index('title')
+            yi = header.index('release_year')
+            di = header.index('director')
+            while True:
+                raw_rows = list(islice(reader, chunk_size))
+                if not raw_rows:
+                    return
+                # Skip blank lines without mistaking an all-blank chunk for EOF
+                rows = [row for row in raw_rows if row]
+                if not rows:
+                    continue
+                titles = [row[ti] for row in rows]
+                directors = _dedupe([row[di] for row in rows], intern_cache)
+                yield MovieTable(
+                    titles,
+                    list(map(_fold, titles)),
+                    array('i', [int(row[yi]) for row in rows]),
+                    directors,
+                    _dedupe(list(map(_fold, directors)), intern_cache),
+                )
+
+    def _stream_movies_arrow(self, chunk_size: int,
+                             intern_cache: Dict[str, str]) -> Iterator[MovieTable]:
+        """pyarrow variant of _stream_movies: CSV parsing runs in C"""
+        if os.path.getsize(self.filename) == 0:
+            # pyarrow rejects an empty file; treat it as a catalog with no movies
+            return
+        reader = pa_csv.open_csv(
+            self.filename,
+            convert_options=pa_csv.ConvertOptions(
+                include_columns=['title', 'release_year', 'director'],
+                column_types={
+                    'title': pa.string(),
+                    'release_year': pa.int64(),
+                    'director': pa.string(),
+                },
+            ),
+        )
+        for batch in reader:
+            # Arrow batches are sized in bytes; re-slice them to chunk_size rows
+            for start in range(0, batch.num_rows, chunk_size):
+                part = batch.slice(start, chunk_size)
+                titles = part.column('title').to_pylist()
+                directors = _dedupe(part.column('director').to_pylist(), intern_cache)
+                # Arrow has no casefold kernel, so folding stays in Python
+                yield MovieTable(
+                    titles,
+                    list(map(_fold, titles)),
+                    array('i', part.column('release_year').to_pylist()),
+                    directors,
+                    _dedupe(list(map(_fold, directors)), intern_cache),
+                )
+
+    def _produce_chunks(self, chunks: queue.Queue) -> None:
+        """Producer side of the load pipeline; always terminates with None"""
+        try:
+            for chunk in self._stream_movies():
+                chunks.put(chunk)
+        finally:
+            chunks.put(None)
 
     def _load_movies(self) -> None:
-        """Load and index movies from CSV"""
+        """Load and index movies from CSV, overlapping parsing with indexing"""
         logger.info(f"Loading movies from {self.filename}")
         try:
-            movies = []
-            with open(self.filename, 'r', encoding='utf-8') as file:
-                reader = csv.DictReader(file)
-                for row in reader:
-                    movie = Movie(
-                        title=row['title'],
-                        release_year=int(row['release_year']),
-                        director=row['director']
-                    )
-                    movies.append(movie)
-            
-            self._movies = movies
-            self._build_index()
+            table = MovieTable.empty()
+            index = self._new_index()
+            chunks: queue.Queue = queue.Queue(maxsize=4)
+
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                producer = executor.submit(self._produce_chunks, chunks)
+                while True:
+                    chunk = chunks.get()
+                    if chunk is None:
+                        break
+                    self._build_index(index, chunk, offset=len(table))
+                    table.extend(chunk)
+                # Re-raise any parsing error from the producer thread
+                producer.result()
+
+            if njit is not None and len(table) >= NUMBA_SCAN_MIN_ROWS:
+                # Pay the JIT compile during load rather than on a user's query
+                _warm_up_scan()
+
+            # A single attribute store publishes table and index together to
+            # lock-free readers of the snapshot property
+            self._generation += 1
+            self._snapshot = MovieSnapshot(table, index, self._generation)
+            if self.on_reload is not None:
+                self.on_reload()
             
         except Exception as e:
             logger.error(f"Error loading movies: {str(e)}")
             raise
 
-    def _build_index(self) -> None:
-        """Build search indices for better performance"""
-        self._index.clear()
-        
-        # Index by year
-        for movie in self._movies:
-            self._index['year'][str(movie.release_year)].append(movie)
-            
-        # Index by director
-        for movie in self._movies:
-            self._index['director'][movie.director.lower()].append(movie)
+    @staticmethod
+    def _new_index() -> Dict[str, Dict[str, array]]:
+        """Create an empty set of search indices"""
+        return defaultdict(lambda: defaultdict(lambda: array('i')))
+
+    @staticmethod
+    def _build_index(index: Dict[str, Dict[str, array]], chunk: MovieTable, offset: int = 0) -> None:
+        """Add a chunk of movies, starting at row offset, to the search indices"""
+        year_idx = index['year']
+        title_ngrams = index['title_ngram']
+        director_ngrams = index['director_ngram']
+
+        # Single pass: each row is touched once for every index. Postings are
+        # integer row positions into the column storage.
+        rows = zip(chunk.years, chunk.titles_lc, chunk.directors_lc)
+        for idx, (year, title_lc, director_lc) in enumerate(rows, offset):
+            year_idx[str(year)].append(idx)
+            for gram in _ngrams(title_lc):
+                title_ngrams[gram].append(idx)
+            for gram in _ngrams(director_lc):
+                director_ngrams[gram].append(idx)
 
 class MovieManager:
-    """Main movie management class with caching and search strategies"""
-    def __init__(self, filename: str):
-        self.data_source = MovieDataSource(filename)
-        self._search_strategies = {
-            SearchCriteria.TITLE: TitleSearchStrategy(),
-            SearchCriteria.YEAR: YearSearchStrategy(),
-            SearchCriteria.DIRECTOR: DirectorSearchStrategy()
+    """Main movie management class with caching and per-criteria search functions"""
+    def __init__(self, filename: str, cache_size: int = 128):
+        self.data_source = MovieDataSource(filename, on_reload=self.clear_cache)
+        self._cache: 'OrderedDict[Tuple[int, SearchCriteria, Any], List[Movie]]' = OrderedDict()
+        self._cache_size = cache_size
+        # Guards the cache bookkeeping only; searches themselves run unlocked
+        self._cache_lock = threading.Lock()
+        self._search_fns: Dict[SearchCriteria, Callable[[MovieSnapshot, Any], List[int]]] = {
+            SearchCriteria.TITLE: search_title,
+            SearchCriteria.YEAR: search_year,
+            SearchCriteria.DIRECTOR: search_director
         }
 
-    @lru_cache(maxsize=128)
+    def clear_cache(self) -> None:
+        """Drop cached search results, e.g. after the CSV is reloaded"""
+        with self._cache_lock:
+            self._cache.clear()
+
     def search(self, criteria: SearchCriteria, query: Any) -> List[Movie]:
-        """Cached search with strategy pattern"""
-        strategy = self._search_strategies[criteria]
-        return strategy.search(self.data_source.movies, query)
+        """Cached search dispatched on the search criteria"""
+        # Read the snapshot once: a changed file invalidates the cache here, and
+        # the search and materialization below all see the same data
+        snapshot = self.data_source.snapshot
+        # The generation in the key keeps a search that raced with a reload
+        # from serving its old results once the new data is in place
+        key = (snapshot.generation, criteria, query)
+        with self._cache_lock:
+            results = self._cache.get(key)
+        if results is not None:
+            return results
+
+        # Search functions work on row indices; only the matches become Movie objects
+        indices = self._search_fns[criteria](snapshot, query)
+        results = snapshot.materialize(indices)
+        with self._cache_lock:
+            self._cache[key] = results
+            if len(self._cache) > self._cache_size:
+                # Evict the oldest entry
+                self._cache.popitem(last=False)
+        return results
 
 class ConsoleUI:
     """Separate UI concerns"""
@@ -135,13 +466,17 @@ class ConsoleUI:
             print("\nNo movies found.")
             return
 
-        print("\nSearch Results:")
-        print("-" * 50)
+        # Build the whole listing and write it once instead of print() per line
+        separator = "-" * 50
+        lines = ["\nSearch Results:", separator]
         for movie in movies:
-            print(f"Title: {movie.title}")
-            print(f"Year: {movie.release_year}")
-            print(f"Director: {movie.director}")
-            print("-" * 50)
+            lines.extend((
+                f"Title: {movie.title}",
+                f"Year: {movie.release_year}",
+                f"Director: {movie.director}",
+                separator,
+            ))
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def run(self) -> None:
         while True:
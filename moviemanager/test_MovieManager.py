@@ -0,0 +1,64 @@
+import io
+import os
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import MovieManager as legacy
+from MovieManager import Movie, MovieManager
+
+
+class TestMissingFile(unittest.TestCase):
+    def setUp(self):
+        self.filename = os.path.join(tempfile.mkdtemp(), 'missing.csv')
+
+    def test_error_printed_once_and_searches_empty(self):
+        output = io.StringIO()
+        with redirect_stdout(output):
+            manager = MovieManager(self.filename)
+            with mock.patch('os.path.exists') as exists, mock.patch('os.path.getmtime') as getmtime:
+                self.assertEqual(manager.search_by_name('x'), [])
+                self.assertEqual(manager.search_by_year(2010), [])
+                self.assertEqual(manager.search_by_director('x'), [])
+                self.assertEqual(manager.movies, [])
+                exists.assert_not_called()
+                getmtime.assert_not_called()
+        self.assertEqual(output.getvalue(), f"Error: File {self.filename} not found!\n")
+
+    def test_script_main(self):
+        output = io.StringIO()
+        with tempfile.TemporaryDirectory() as directory:
+            cwd = os.getcwd()
+            os.chdir(directory)
+            self.addCleanup(os.chdir, cwd)
+            with redirect_stdout(output), mock.patch('builtins.input', side_effect=['1', 'x', '4']):
+                legacy.main()
+        self.assertIn("Error: File movies.csv not found!", output.getvalue())
+        self.assertIn("No movies found.", output.getvalue())
+
+
+class TestSearch(unittest.TestCase):
+    def setUp(self):
+        handle, self.filename = tempfile.mkstemp(suffix='.csv')
+        os.close(handle)
+        self.addCleanup(os.remove, self.filename)
+        with open(self.filename, 'w', encoding='utf-8') as file:
+            file.write('title,release_year,director\n'
+                       'Inception,2010,Christopher Nolan\n'
+                       'The Godfather,1972,Francis Ford Coppola\n')
+        self.manager = MovieManager(self.filename)
+
+    def test_search_methods_return_movies(self):
+        inception = Movie('Inception', 2010, 'Christopher Nolan')
+        self.assertEqual(self.manager.search_by_name('incep'), [inception])
+        self.assertEqual(self.manager.search_by_year('2010'), [inception])
+        self.assertEqual(self.manager.search_by_director('NOLAN'), [inception])
+        self.assertEqual(len(self.manager.movies), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
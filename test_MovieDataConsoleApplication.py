@@ -0,0 +1,324 @@
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from array import array
+from unittest import mock
+
+import MovieDataConsoleApplication as app
+
+from MovieDataConsoleApplication import Movie, MovieManager, MovieDataSource, SearchCriteria
+
+MOVIES = [
+    ('The Shawshank Redemption', 1994, 'Frank Darabont'),
+    ('Inception', 2010, 'Christopher Nolan'),
+    ('The Godfather', 1972, 'Francis Ford Coppola'),
+    ('Interstellar', 2014, 'Christopher Nolan'),
+]
+
+QUERIES = ['', 'a', 'in', 'the', 'THE', 'nolan', 'olan', 'stell', 'ford cop', 'zzz', 'xyzzy']
+
+
+def write_csv(path, movies, header='title,release_year,director\n'):
+    with open(path, 'w', encoding='utf-8') as file:
+        file.write(header)
+        for title, year, director in movies:
+            file.write(f'{title},{year},{director}\n')
+
+
+def bump_mtime(path):
+    future = time.time() + 10
+    os.utime(path, (future, future))
+
+
+class CsvTestCase(unittest.TestCase):
+    def setUp(self):
+        handle, self.filename = tempfile.mkstemp(suffix='.csv')
+        os.close(handle)
+        self.addCleanup(os.remove, self.filename)
+
+
+class TestNgramSearch(CsvTestCase):
+    def setUp(self):
+        super().setUp()
+        write_csv(self.filename, MOVIES)
+        self.manager = MovieManager(self.filename)
+
+    def linear(self, attr, query):
+        return [Movie(*movie) for movie in MOVIES if query.lower() in movie[attr].lower()]
+
+    def test_title_matches_linear_scan(self):
+        for query in QUERIES:
+            with self.subTest(query=query):
+                self.assertEqual(self.manager.search(SearchCriteria.TITLE, query),
+                                 self.linear(0, query))
+
+    def test_director_matches_linear_scan(self):
+        for query in QUERIES:
+            with self.subTest(query=query):
+                self.assertEqual(self.manager.search(SearchCriteria.DIRECTOR, query),
+                                 self.linear(2, query))
+
+
+    def test_index_path_matches_fallback(self):
+        snapshot = self.manager.data_source.snapshot
+        unindexed = app.MovieSnapshot(snapshot.table, MovieDataSource._new_index())
+        for query in QUERIES:
+            with self.subTest(query=query):
+                self.assertEqual(app.search_title(snapshot, query),
+                                 app.search_title(unindexed, query))
+                self.assertEqual(app.search_director(snapshot, query),
+                                 app.search_director(unindexed, query))
+
+class TestCaseFolding(CsvTestCase):
+    UNICODE_MOVIES = [
+        ('Die Straße', 2001, 'Fatih Akın'),
+        ('CAFÉ Society', 2016, 'Woody Allen'),
+        ('Ｆｕｌｌ Ｗｉｄｔｈ', 2016, 'Woody Allen'),
+    ]
+
+    def setUp(self):
+        super().setUp()
+        write_csv(self.filename, MOVIES + self.UNICODE_MOVIES)
+        self.manager = MovieManager(self.filename)
+
+    def titles(self, query):
+        return [movie.title for movie in self.manager.search(SearchCriteria.TITLE, query)]
+
+    def test_sharp_s_folds_to_ss(self):
+        self.assertEqual(self.titles('STRASSE'), ['Die Straße'])
+        self.assertEqual(self.titles('ß'), ['Die Straße'])
+
+    def test_accented_query(self):
+        self.assertEqual(self.titles('café'), ['CAFÉ Society'])
+
+    def test_compatibility_forms(self):
+        self.assertEqual(self.titles('full width'), ['Ｆｕｌｌ Ｗｉｄｔｈ'])
+
+    def test_director(self):
+        self.assertEqual(self.manager.search(SearchCriteria.DIRECTOR, 'AKın'),
+                         [Movie(*self.UNICODE_MOVIES[0])])
+
+    def test_index_matches_folded_linear_scan(self):
+        for query in ['ß', 'ss', 'strasse', 'café', 'akın', 'ｆｕｌｌ', 'woody']:
+            with self.subTest(query=query):
+                folded = app._fold(query)
+                expected = [Movie(*movie) for movie in MOVIES + self.UNICODE_MOVIES
+                            if folded in app._fold(movie[0])]
+                self.assertEqual(self.manager.search(SearchCriteria.TITLE, query), expected)
+
+class TestYearSearch(CsvTestCase):
+    def setUp(self):
+        super().setUp()
+        write_csv(self.filename, MOVIES + [('Memento', 2010, 'Christopher Nolan')])
+        self.manager = MovieManager(self.filename)
+
+    def test_year_from_index(self):
+        self.assertEqual(self.manager.search(SearchCriteria.YEAR, 2010),
+                         [Movie(*MOVIES[1]), Movie('Memento', 2010, 'Christopher Nolan')])
+
+    def test_unknown_year(self):
+        self.assertEqual(self.manager.search(SearchCriteria.YEAR, 1800), [])
+
+
+class TestIndex(CsvTestCase):
+    def test_only_consulted_indices_are_built(self):
+        write_csv(self.filename, MOVIES)
+        index = MovieDataSource(self.filename).index
+        self.assertEqual(set(index), {'year', 'title_ngram', 'director_ngram'})
+
+
+class TestIntersectSorted(unittest.TestCase):
+    def test_matches_set_intersection(self):
+        rng = random.Random(0)
+        for _ in range(200):
+            lists = [array('i', sorted(rng.sample(range(300), rng.randint(0, 150))))
+                     for _ in range(rng.randint(1, 5))]
+            expected = sorted(set.intersection(*map(set, lists)))
+            self.assertEqual(app._intersect_sorted(lists), expected)
+
+    def test_no_lists(self):
+        self.assertEqual(app._intersect_sorted([]), [])
+
+
+class TestLoading(CsvTestCase):
+    def test_empty_file(self):
+        self.assertEqual(MovieDataSource(self.filename).movies, [])
+
+    def test_header_only(self):
+        write_csv(self.filename, [])
+        self.assertEqual(MovieDataSource(self.filename).movies, [])
+
+    def test_column_order_from_header(self):
+        write_csv(self.filename, [('Nolan', 'Inception', 2010)],
+                  header='director,title,release_year\n')
+        self.assertEqual(MovieDataSource(self.filename).movies,
+                         [Movie('Inception', 2010, 'Nolan')])
+
+
+    def test_blank_lines_spanning_a_chunk(self):
+        with open(self.filename, 'w', encoding='utf-8') as file:
+            file.write('title,release_year,director\n')
+            file.write('A,2000,X\n' * 8192)
+            file.write('\n' * 8192)
+            file.write('B,2001,Y\n')
+        manager = MovieManager(self.filename)
+        self.assertEqual(len(manager.data_source.movies), 8193)
+        self.assertEqual(manager.search(SearchCriteria.TITLE, 'b'), [Movie('B', 2001, 'Y')])
+
+    @unittest.skipUnless(app.pa is not None, 'pyarrow is not installed')
+    def test_pyarrow_matches_csv_module(self):
+        write_csv(self.filename, MOVIES)
+        with_arrow = MovieDataSource(self.filename).table
+        with mock.patch.object(app, 'pa', None):
+            without_arrow = MovieDataSource(self.filename).table
+        self.assertEqual(with_arrow, without_arrow)
+
+    @unittest.skipUnless(app.pa is not None, 'pyarrow is not installed')
+    def test_pyarrow_empty_file(self):
+        self.assertEqual(MovieDataSource(self.filename).movies, [])
+
+@unittest.skipUnless(app.njit is not None, 'numba is not installed')
+class TestNumbaScan(CsvTestCase):
+    SHORT_QUERIES = ['', 'a', 'in', 'TH', 'ß', 'é', 'zz']
+
+    def setUp(self):
+        super().setUp()
+        write_csv(self.filename, MOVIES + TestCaseFolding.UNICODE_MOVIES)
+        patcher = mock.patch.object(app, 'NUMBA_SCAN_MIN_ROWS', 1)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_matches_python_scan(self):
+        snapshot = MovieDataSource(self.filename).snapshot
+        self.assertEqual(snapshot.packed, {})
+        for query in self.SHORT_QUERIES:
+            with self.subTest(query=query):
+                jitted = app.search_title(snapshot, query)
+                with mock.patch.object(app, 'njit', None):
+                    self.assertEqual(jitted, app.search_title(snapshot, query))
+        self.assertIn('title', snapshot.packed)
+
+    def test_kernel_compiled_during_load(self):
+        with mock.patch.object(app, '_scan_compiled', False):
+            MovieDataSource(self.filename).snapshot
+            self.assertTrue(app._scan_compiled)
+
+    def test_warm_up_signature_reused_by_queries(self):
+        snapshot = MovieDataSource(self.filename).snapshot
+        signatures = list(app._scan.signatures)
+        app.search_title(snapshot, 'in')
+        self.assertEqual(app._scan.signatures, signatures)
+
+class TestReload(CsvTestCase):
+    def setUp(self):
+        super().setUp()
+        write_csv(self.filename, MOVIES[:2])
+        self.manager = MovieManager(self.filename)
+
+    def test_cache_cleared_after_mtime_change(self):
+        self.assertEqual(self.manager.search(SearchCriteria.YEAR, 1972), [])
+        write_csv(self.filename, MOVIES)
+        bump_mtime(self.filename)
+        self.manager.data_source.reload()
+        self.assertEqual(self.manager.search(SearchCriteria.YEAR, 1972), [Movie(*MOVIES[2])])
+
+    def test_stale_store_not_served_after_reload(self):
+        write_csv(self.filename, MOVIES)
+        search_year = app.search_year
+
+        def search_then_reload(snapshot, query):
+            result = search_year(snapshot, query)
+            write_csv(self.filename, MOVIES[:1])
+            bump_mtime(self.filename)
+            self.manager.data_source.reload()
+            return result
+
+        self.manager.data_source.reload()
+        with mock.patch.dict(self.manager._search_fns, {SearchCriteria.YEAR: search_then_reload}):
+            self.assertEqual(self.manager.search(SearchCriteria.YEAR, 1972), [Movie(*MOVIES[2])])
+        self.assertEqual(self.manager.search(SearchCriteria.YEAR, 1972), [])
+
+
+    def test_mtime_check_is_throttled(self):
+        self.manager.search(SearchCriteria.YEAR, 1972)
+        write_csv(self.filename, MOVIES)
+        bump_mtime(self.filename)
+        with mock.patch.object(app.os.path, 'getmtime', wraps=os.path.getmtime) as getmtime:
+            # Within the check interval the old data is served without a stat()
+            self.assertEqual(self.manager.search(SearchCriteria.YEAR, 1972), [])
+            getmtime.assert_not_called()
+        self.manager.data_source.reload()
+        self.assertEqual(self.manager.search(SearchCriteria.YEAR, 1972), [Movie(*MOVIES[2])])
+
+    def test_concurrent_first_load_loads_once(self):
+        source = MovieDataSource(self.filename)
+        snapshots = []
+        barrier = threading.Barrier(8)
+
+        def read_snapshot():
+            barrier.wait()
+            snapshots.append(source.snapshot)
+
+        with mock.patch.object(source, '_load_movies', wraps=source._load_movies) as load:
+            threads = [threading.Thread(target=read_snapshot) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        self.assertEqual(load.call_count, 1)
+        self.assertEqual(len({id(snapshot) for snapshot in snapshots}), 1)
+
+    def test_reload_between_search_and_materialize(self):
+        write_csv(self.filename, [MOVIES[1]] * 10)
+        self.manager.data_source.reload()
+        search_year = app.search_year
+
+        def search_then_shrink(snapshot, query):
+            result = search_year(snapshot, query)
+            write_csv(self.filename, [MOVIES[1]])
+            bump_mtime(self.filename)
+            self.manager.data_source.reload()
+            return result
+
+        with mock.patch.dict(self.manager._search_fns, {SearchCriteria.YEAR: search_then_shrink}):
+            # Results come from the snapshot the search started on
+            self.assertEqual(len(self.manager.search(SearchCriteria.YEAR, 2010)), 10)
+
+class TestConcurrentSearch(CsvTestCase):
+    def test_small_cache_under_many_threads(self):
+        write_csv(self.filename, MOVIES)
+        manager = MovieManager(self.filename, cache_size=2)
+        # Switch threads as often as possible to expose races in the cache
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        self.addCleanup(sys.setswitchinterval, interval)
+        years = [movie[1] for movie in MOVIES] + [1800, 1801]
+        errors = []
+        barrier = threading.Barrier(8)
+
+        def worker(offset):
+            barrier.wait()
+            try:
+                for i in range(10000):
+                    year = years[(i + offset) % len(years)]
+                    found = manager.search(SearchCriteria.YEAR, year)
+                    self.assertEqual(found, [Movie(*m) for m in MOVIES if m[1] == year])
+                    if i % 50 == 0:
+                        manager.clear_cache()
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        self.assertLessEqual(len(manager._cache), 2)
+
+if __name__ == '__main__':
+    unittest.main()